@@ -39,6 +39,8 @@ import numpy as np
 from scipy.stats import scoreatpercentile, nbinom, norm
 from scipy.optimize import fmin
 
+from . import segregation
+
 # define plt as a global so that we can import
 # matplotlib later if we need it
 plt = None
@@ -746,8 +748,7 @@ def threshold_file(input_file, output_file,
     :param func fitting_function: Function to use for thresholding each NP.
     """
 
-    coverage_data = pd.read_csv(input_file,
-                                delim_whitespace=True, index_col=[0, 1, 2])
+    coverage_data = segregation.read_window_table(input_file)
 
     segregation_matrix, fitting_data = do_coverage_thresholding(
         coverage_data, fitting_folder, fitting_function)
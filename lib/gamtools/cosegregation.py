@@ -29,6 +29,7 @@ that best accounts for such detection effects is the
 """
 from __future__ import print_function
 import itertools
+import multiprocessing
 import time
 import warnings
 import sys
@@ -41,6 +42,17 @@ from . import segregation, matrix
 from .utils import format_genomic_distance
 
 
+# Number of set bits in each possible value of a byte
+POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Maximum size (in bytes) of the intermediate arrays used by cosegregation_packed
+PACKED_CHUNK_BYTES = 2 ** 24
+
+# Minimum number of samples for which cosegregation_packed is faster than
+# the cosegregation_2d C function
+PACKED_MIN_SAMPLES = 200
+
+
 class InvalidDataError(Exception):
     """
     Exception raised if segregation data contains anything other than 0s and 1s.
@@ -56,14 +68,11 @@ def regions_are_valid(regions):
     :returns: Returns False if any regions contain invalid data, otherwise True.
     """
 
-    allowed_values = set([0, 1])
-    region_unique_values = [
-        set(np.unique(np.array(region).ravel())) for region in regions]
-    invalid_regions = [not region_values.issubset(
-        allowed_values) for region_values in region_unique_values]
+    for region in regions:
+        region = np.asarray(region)
 
-    if any(invalid_regions):
-        return False
+        if not np.logical_or(region == 0, region == 1).all():
+            return False
 
     return True
 
@@ -84,11 +93,13 @@ def prepare_regions(regions):
     if not regions_are_valid(regions):
         raise InvalidDataError('Region contains integers greater than 1')
 
+    # Make at most one copy of each region. The kernels in
+    # cosegregation_internal iterate over samples, so rows must be contiguous
+    regions = [np.ascontiguousarray(r, dtype=int) for r in regions]
+
     if len(regions) == 1:
         regions = regions * 2
 
-    regions = [np.array(r.astype(int)) for r in regions]
-
     return regions
 
 
@@ -99,8 +110,10 @@ def cosegregation_frequency_ndim(loci):
     n is the number of genomic windows (loci) and x is the number of samples. It calculates
     the number of times from 0 to n of the windows are all found in the same tube.
 
-    This is a pure python function, so it is relatively slow, but it can calculate
-    the co-segregation of any number of windows.
+    Each sample is converted to a flat index into the contingency table,
+    and the whole table is tallied with a single call to
+    :func:`numpy.bincount`. The table has 2 ** n entries, one for each
+    combination of presence and absence of the n windows.
 
     :param loci: Array giving the segregation of n loci across x samples.
     :type loci: :class:`~numpy.ndarray`
@@ -110,13 +123,11 @@ def cosegregation_frequency_ndim(loci):
 
     counts_shape = (2,) * loci.shape[0]
 
-    counts = np.zeros(counts_shape)
+    flat_index = np.ravel_multi_index(tuple(loci), counts_shape)
 
-    for sample in loci.T:
+    counts = np.bincount(flat_index, minlength=2 ** loci.shape[0])
 
-        counts[tuple(sample)] += 1
-
-    return counts
+    return counts.reshape(counts_shape).astype(float)
 
 
 def get_index_combinations(regions):
@@ -156,9 +167,10 @@ def cosegregation_nd(*regions):
     contingency table, giving the number of times locus x cosegregates
     with loci y and z.
 
-    This function has a pure python inner and outer loop, so it is
-    very slow, but it has the advantage of being applicable in an
-    unlimited number of dimensions. Optimized functions for
+    The segregation of each region is expanded into an absent/present
+    indicator array, and the full table is then obtained from a single
+    tensor contraction over samples with :func:`numpy.einsum`, so it can be
+    applied in an unlimited number of dimensions. Optimized functions for
     obtaining the co-segregation of two or three regions can
     be found in the cosegregation_optimized module.
 
@@ -167,37 +179,82 @@ def cosegregation_nd(*regions):
             of all possible combinations of windows within the different regions.
     """
 
-    combinations = get_index_combinations(regions)
+    n_regions = len(regions)
+    sample_axis = 2 * n_regions
 
-    full_data = np.concatenate(regions, axis=0).astype(int)
+    einsum_args = []
 
-    def get_frequency(indices):
-        """
-        Internal function to get the cosegregation_frequency for
-        a given combination of columns from full_data.
-        """
+    for i, region in enumerate(regions):
 
-        return cosegregation_frequency_ndim(full_data[indices, :])
+        region = np.asarray(region, dtype=float)
 
-    result = list(map(get_frequency, combinations))
+        # Axis 1 of each operand indexes absence (0) or presence (1)
+        presence = np.stack([1. - region, region], axis=1)
 
-    result_shape = tuple([len(region)
-                          for region in regions]) + (2, ) * len(regions)
+        einsum_args.extend([presence, [i, n_regions + i, sample_axis]])
 
-    freqs = np.array(result).reshape(result_shape)
+    freqs = np.einsum(*einsum_args + [list(range(sample_axis))], optimize=True)
 
     return freqs
 
 
+def pack_region(region):
+    """Pack the segregation of a region into a bit array.
+
+    Each window is stored as one row of bytes, with one bit per sample
+    (see :func:`numpy.packbits`), so that the region takes up 64 times
+    less memory than an array of 64-bit integers.
+
+    :param region: :ref:`Region <regions>` containing only 0s and 1s.
+    :returns: :class:`numpy array <numpy.ndarray>` of uint8 with one row \
+            per window.
+    """
+
+    return np.packbits(np.asarray(region, dtype=np.uint8), axis=1)
+
+
+def cosegregation_packed(region_a, region_b):
+    """Get the co-segregation matrix for two regions from their packed bits.
+
+    Both regions are converted with :func:`pack_region`, and the number of
+    samples in which window x of region_a and window y of region_b are both
+    present is obtained by counting the set bits of (x AND y). Windows from
+    region_a are processed in chunks so that the intermediate arrays never
+    exceed PACKED_CHUNK_BYTES.
+
+    :param region_a: First :ref:`region <regions>`.
+    :param region_b: Second :ref:`region <regions>`.
+    :returns: :ref:`proximity matrix <proximity_matrices>` giving the co-segregation \
+            of all possible combinations of windows within the two regions.
+    """
+
+    bits_a, bits_b = pack_region(region_a), pack_region(region_b)
+
+    result = np.zeros((len(bits_a), len(bits_b)), dtype=np.float64)
+
+    chunk_size = max(1, PACKED_CHUNK_BYTES // max(1, bits_b.size))
+
+    for start in range(0, len(bits_a), chunk_size):
+
+        both_present = bits_a[start:start + chunk_size, None, :] & bits_b[None, :, :]
+
+        result[start:start + chunk_size] = POPCOUNT_TABLE[both_present].sum(axis=-1)
+
+    return result
+
+
 def get_cosegregation_from_regions(*regions):
     """Get the full co-segregation table for n regions, using optimized
     functions where available.
 
     This is a wrapper which determines the correct co-segregation
     function to call based on the number of regions. Where there
-    are two or three regions, optimized C functions are used. Where
-    there are more than three regions, the non-optimized python
-    algorithm is used.
+    are two regions, co-segregation is counted on bit-packed data
+    (see :func:`cosegregation_packed`) if there are at least
+    PACKED_MIN_SAMPLES samples, otherwise an optimized C function is
+    used. Where there are three regions,
+    an optimized C function is used. Where there are more than three
+    regions, the generic numpy algorithm (:func:`cosegregation_nd`) is used.
 
     :param list regions: List of :ref:`regions <regions>`.
     :returns: :ref:`proximity matrix <proximity_matrices>` giving the co-segregation \
@@ -207,7 +264,10 @@ def get_cosegregation_from_regions(*regions):
     regions = prepare_regions(regions)
 
     if len(regions) == 2:
-        coseg_func = cosegregation_2d
+        if regions[0].shape[1] >= PACKED_MIN_SAMPLES:
+            coseg_func = cosegregation_packed
+        else:
+            coseg_func = cosegregation_2d
     elif len(regions) == 3:
         coseg_func = cosegregation_3d
     else:
@@ -337,6 +397,62 @@ MATRIX_TYPES = {
 }
 
 
+def _matrix_from_chunk(args):
+    """
+    Internal function that calculates one chunk of a proximity matrix
+    in a worker process (see :func:`matrix_from_regions`).
+    """
+
+    matrix_func, regions = args
+
+    return matrix_func(*regions)
+
+
+def matrix_from_regions(matrix_func, regions, processes=1):
+    """Calculate a proximity matrix, optionally splitting the work between
+    several processes.
+
+    Each row of a :ref:`proximity matrix <proximity_matrices>` only depends on
+    one window of the first region, so the first region is split into equally
+    sized chunks of windows. The matrix for each chunk is calculated in a
+    separate process and the results are concatenated.
+
+    :param func matrix_func: Function used to calculate the matrix \
+            (one of the values of MATRIX_TYPES).
+    :param list regions: List of :ref:`regions <regions>`.
+    :param int processes: Number of processes to use.
+    :returns: :ref:`proximity matrix <proximity_matrices>` giving the \
+            output of matrix_func for all possible combinations of windows \
+            within the different regions.
+    """
+
+    # A single region is compared against itself, so make sure only
+    # one copy of it gets split into chunks
+    if len(regions) == 1:
+        regions = regions * 2
+
+    processes = min(processes, len(regions[0]))
+
+    if processes <= 1:
+        return matrix_func(*regions)
+
+    chunk_bounds = np.linspace(0, len(regions[0]), processes + 1).astype(int)
+
+    chunk_args = [
+        (matrix_func, [np.asarray(regions[0])[start:stop]] + list(regions[1:]))
+        for start, stop in zip(chunk_bounds[:-1], chunk_bounds[1:])]
+
+    pool = multiprocessing.Pool(processes)
+
+    try:
+        chunk_matrices = pool.map(_matrix_from_chunk, chunk_args)
+    finally:
+        pool.close()
+        pool.join()
+
+    return np.concatenate(chunk_matrices, axis=0)
+
+
 def get_regions_and_windows(segregation_data, location_strings):
     """Get the windows which fall into a given genomic location, and the
     segregation of those windows across samples.
@@ -366,7 +482,7 @@ def get_regions_and_windows(segregation_data, location_strings):
 
 
 def matrix_from_segregation_file(
-        segregation_file, location_strings, matrix_type='dprime'):
+        segregation_file, location_strings, matrix_type='dprime', processes=1):
     """Get the proximity matrix between the given genomic locations, and the
     locations of the genomic windows corresponding to each axis of the
     proximity matrix.
@@ -390,6 +506,9 @@ def matrix_from_segregation_file(
 
     :param segregation_file: Path to input :ref:`segregation table <segregation_table>`
     :param list location_strings: One or more :ref:`location strings <location_string>`
+    :param str matrix_type: Type of :ref:`proximity matrix <proximity_matrices>`\
+            to calculate.
+    :param int processes: Number of processes to use (see :func:`matrix_from_regions`).
     :returns: A :ref:`proximity matrix <proximity_matrices>` for the given \
             genomic locations, and a list of tuples giving window locations \
             in the form (chromosome, start, stop).
@@ -401,14 +520,14 @@ def matrix_from_segregation_file(
     regions, windows = get_regions_and_windows(
         segregation_data, location_strings)
     matrix_func = MATRIX_TYPES[matrix_type]
-    contact_matrix = matrix_func(*regions)
+    contact_matrix = matrix_from_regions(matrix_func, regions, processes)
 
     return contact_matrix, windows
 
 
-def create_and_save_contact_matrix(segregation_file, location_strings,
+def create_and_save_contact_matrix(segregation_file, location_strings, #pylint: disable=too-many-arguments
                                    output_file, output_format,
-                                   matrix_type='dprime'):
+                                   matrix_type='dprime', processes=1):
     """Calculate the proximity matrix for the given genomic locations and save it
     to disk.
 
@@ -437,17 +556,18 @@ def create_and_save_contact_matrix(segregation_file, location_strings,
             (see :ref:`matrix_formats` for more details)
     :param str matrix_type: Type of :ref:`proximity matrix <proximity_matrices>`\
             to calculate.
+    :param int processes: Number of processes to use (see :func:`matrix_from_regions`).
     """
 
     print('starting calculation for {}'.format(' x '.join(location_strings)))
-    start_time = time.clock()
+    start_time = time.time()
 
     contact_matrix, windows = matrix_from_segregation_file(
-        segregation_file, location_strings, matrix_type)
+        segregation_file, location_strings, matrix_type, processes)
 
     size_string = ' x '.join([str(s) for s in contact_matrix.shape])
     print('region size is: {}'.format(size_string), end=' ')
-    print('Calculation took {0}s'.format(time.clock() - start_time))
+    print('Calculation took {0}s'.format(time.time() - start_time))
     print('Saving matrix to file {}'.format(output_file))
 
     output_func = matrix.OUTPUT_FORMATS[output_format]
@@ -537,7 +657,7 @@ def matrix_from_args(args):
 
     create_and_save_contact_matrix(args.segregation_file, args.regions,
                                    args.output_file, args.output_format,
-                                   args.matrix_type)
+                                   args.matrix_type, args.processes)
 
 
 def matrix_from_doit(output_file, segregation_file, region):
@@ -19,6 +19,11 @@ DTYPE = np.int
 
 ctypedef np.int_t DTYPE_t
 
+# Each kernel tallies the contingency table for one combination of windows
+# in local C integers, rather than filling a (aN, bN, ..., 2, 2) temporary
+# array, so memory use is limited to the output matrix. Inputs are
+# assumed to contain only 0s and 1s (see cosegregation.prepare_regions).
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def cosegregation_2d(np.ndarray[DTYPE_t, ndim=2] a,
@@ -29,29 +34,22 @@ def cosegregation_2d(np.ndarray[DTYPE_t, ndim=2] a,
 
     cdef int M = a.shape[1]
 
-    cdef np.ndarray[DTYPE_t, ndim=4] temp = np.zeros([aN, bN, 2, 2], dtype=DTYPE)
     cdef np.ndarray[np.float64_t, ndim=2] result = np.zeros([aN, bN], dtype=np.float64)
 
     cdef int ai
     cdef int bi
     cdef int i
 
-    cdef int ax
-    cdef int bx
-
     cdef int AB
 
     for ai in range(aN):
         for bi in range(bN):
 
-            for i in range(M):
+            AB = 0
 
-                ax = a[ai,i]
-                bx = b[bi,i]
-
-                temp[ai, bi, ax, bx] += 1
+            for i in range(M):
 
-            AB = temp[ai, bi, 1, 1]
+                AB += a[ai,i] & b[bi,i]
 
             result[ai, bi] = AB
 
@@ -62,14 +60,13 @@ def cosegregation_2d(np.ndarray[DTYPE_t, ndim=2] a,
 def cosegregation_3d(np.ndarray[DTYPE_t, ndim=2] a,
                 np.ndarray[DTYPE_t, ndim=2] b,
                 np.ndarray[DTYPE_t, ndim=2] c):
-    
+
     cdef int aN = a.shape[0]
     cdef int bN = b.shape[0]
     cdef int cN = c.shape[0]
-    
+
     cdef int M = a.shape[1]
 
-    cdef np.ndarray[DTYPE_t, ndim=6] temp = np.zeros([aN, bN, cN, 2, 2, 2], dtype=DTYPE)
     cdef np.ndarray[np.float64_t, ndim=3] result = np.zeros([aN, bN, cN], dtype=np.float64)
 
     cdef int ai
@@ -77,26 +74,17 @@ def cosegregation_3d(np.ndarray[DTYPE_t, ndim=2] a,
     cdef int ci
     cdef int i
 
-    cdef int ax
-    cdef int bx
-    cdef int cx
-
     cdef int ABC
 
-    
     for ai in range(aN):
         for bi in range(bN):
             for ci in range(cN):
 
+                ABC = 0
+
                 for i in range(M):
-                    
-                    ax = a[ai,i]
-                    bx = b[bi,i]
-                    cx = c[ci,i]
-                    
-                    temp[ai, bi, ci, ax, bx, cx] += 1
 
-                ABC = temp[ai, bi, ci, 1, 1, 1]
+                    ABC += a[ai,i] & b[bi,i] & c[ci,i]
 
                 result[ai, bi, ci] = ABC
 
@@ -112,7 +100,6 @@ def linkage_2d(np.ndarray[DTYPE_t, ndim=2] a,
 
     cdef int M = a.shape[1]
 
-    cdef np.ndarray[DTYPE_t, ndim=4] temp = np.zeros([aN, bN, 2, 2], dtype=DTYPE)
     cdef np.ndarray[np.float64_t, ndim=2] result = np.zeros([aN, bN], dtype=np.float64)
 
     cdef int ai
@@ -135,18 +122,18 @@ def linkage_2d(np.ndarray[DTYPE_t, ndim=2] a,
     for ai in range(aN):
         for bi in range(bN):
 
+            A = 0
+            B = 0
+            AB = 0
+
             for i in range(M):
 
                 ax = a[ai,i]
                 bx = b[bi,i]
 
-                temp[ai, bi, ax, bx] += 1
-
-            AB = temp[ai, bi, 1, 1]
-            A = (temp[ai, bi, 1, 1] +
-                 temp[ai, bi, 1, 0])
-            B = (temp[ai, bi, 1, 1] +
-                 temp[ai, bi, 0, 1])
+                A += ax
+                B += bx
+                AB += ax & bx
 
             if (A == 0) or (B == 0):
                 result[ai, bi] = np.NaN
@@ -168,14 +155,13 @@ def linkage_2d(np.ndarray[DTYPE_t, ndim=2] a,
 def linkage_3d(np.ndarray[DTYPE_t, ndim=2] a,
                 np.ndarray[DTYPE_t, ndim=2] b,
                 np.ndarray[DTYPE_t, ndim=2] c):
-    
+
     cdef int aN = a.shape[0]
     cdef int bN = b.shape[0]
     cdef int cN = c.shape[0]
-    
+
     cdef int M = a.shape[1]
 
-    cdef np.ndarray[DTYPE_t, ndim=6] temp = np.zeros([aN, bN, cN, 2, 2, 2], dtype=DTYPE)
     cdef np.ndarray[np.float64_t, ndim=3] result = np.zeros([aN, bN, cN], dtype=np.float64)
 
     cdef int ai
@@ -190,7 +176,7 @@ def linkage_3d(np.ndarray[DTYPE_t, ndim=2] a,
     cdef int A
     cdef int B
     cdef int C
-    
+
     cdef int AB
     cdef int AC
     cdef int BC
@@ -208,40 +194,32 @@ def linkage_3d(np.ndarray[DTYPE_t, ndim=2] a,
     cdef float dAC
     cdef float dBC
     cdef float d
-    
+
     for ai in range(aN):
         for bi in range(bN):
             for ci in range(cN):
 
+                A = 0
+                B = 0
+                C = 0
+                AB = 0
+                AC = 0
+                BC = 0
+                ABC = 0
+
                 for i in range(M):
-                    
+
                     ax = a[ai,i]
                     bx = b[bi,i]
                     cx = c[ci,i]
-                    
-                    temp[ai, bi, ci, ax, bx, cx] += 1
-
-                A = (temp[ai, bi, ci, 1, 1, 1] +
-                     temp[ai, bi, ci, 1, 0, 1] +
-                     temp[ai, bi, ci, 1, 1, 0] +
-                     temp[ai, bi, ci, 1, 0, 0])
-                B = (temp[ai, bi, ci, 1, 1, 1] +
-                     temp[ai, bi, ci, 0, 1, 1] +
-                     temp[ai, bi, ci, 1, 1, 0] +
-                     temp[ai, bi, ci, 0, 1, 0])
-                C = (temp[ai, bi, ci, 1, 1, 1] +
-                     temp[ai, bi, ci, 1, 0, 1] +
-                     temp[ai, bi, ci, 0, 1, 1] +
-                     temp[ai, bi, ci, 0, 0, 1])
-
-                AB = (temp[ai, bi, ci, 1, 1, 1] +
-                      temp[ai, bi, ci, 1, 1, 0])
-                AC = (temp[ai, bi, ci, 1, 1, 1] +
-                      temp[ai, bi, ci, 1, 0, 1])
-                BC = (temp[ai, bi, ci, 1, 1, 1] +
-                      temp[ai, bi, ci, 0, 1, 1])
-
-                ABC = temp[ai, bi, ci, 1, 1, 1]
+
+                    A += ax
+                    B += bx
+                    C += cx
+                    AB += ax & bx
+                    AC += ax & cx
+                    BC += bx & cx
+                    ABC += ax & bx & cx
 
                 if (A == 0) or (B == 0) or (C==0):
                     result[ai, bi, ci] = np.NaN
@@ -268,13 +246,12 @@ def linkage_3d(np.ndarray[DTYPE_t, ndim=2] a,
 @cython.wraparound(False)
 def dprime_2d(np.ndarray[DTYPE_t, ndim=2] a,
               np.ndarray[DTYPE_t, ndim=2] b):
-    
+
     cdef int aN = a.shape[0]
     cdef int bN = b.shape[0]
-    
+
     cdef int M = a.shape[1]
 
-    cdef np.ndarray[DTYPE_t, ndim=4] temp = np.zeros([aN, bN, 2, 2], dtype=DTYPE)
     cdef np.ndarray[np.float64_t, ndim=2] result = np.zeros([aN, bN], dtype=np.float64)
 
     cdef int ai
@@ -293,22 +270,22 @@ def dprime_2d(np.ndarray[DTYPE_t, ndim=2] a,
     cdef float Bp
     cdef float Ep
     cdef float d
-    
+
     for ai in range(aN):
         for bi in range(bN):
 
+            A = 0
+            B = 0
+            AB = 0
+
             for i in range(M):
-                
+
                 ax = a[ai,i]
                 bx = b[bi,i]
-                
-                temp[ai, bi, ax, bx] += 1
 
-            AB = temp[ai, bi, 1, 1]
-            A = (temp[ai, bi, 1, 1] +
-                 temp[ai, bi, 1, 0])
-            B = (temp[ai, bi, 1, 1] +
-                 temp[ai, bi, 0, 1])
+                A += ax
+                B += bx
+                AB += ax & bx
 
             if (A == 0) or (B == 0):
                 result[ai, bi] = np.NaN
@@ -340,4 +317,3 @@ def dprime_2d(np.ndarray[DTYPE_t, ndim=2] a,
                     result[ai, bi] = 0.
 
     return result
-
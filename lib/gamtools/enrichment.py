@@ -138,48 +138,23 @@ def randomize_doublets(doublets_orig, chrom_lengths):
 
     shift = np.random.randint(1, max(chrom_lengths.values()))
 
-    def randomize_chrom(chrom, shift):
-        """
-        Internal function that shifts all interactions on a given
-        chromosome `chrom` by an amount `shift`.
-        """
-
-        chrom_len = chrom_lengths[chrom]
-
-        # If a shift is bigger than the length of the chromosome,
-        # the end result is the same as shifting by the remainder
-        # when shift is divided by the chromosome length
-        chrom_shift = shift % chrom_len
-
-        # Shift both positions by chrom_shift
-        doublets_df.ix[doublets_df.chrom == chrom,
-                       ['Pos_A', 'Pos_B']] = np.array(
-                           doublets_df.ix[doublets_df.chrom == chrom,
-                                          ['Pos_A', 'Pos_B']]) + chrom_shift
-
-        # Check left doesn't extend past chromosome end
-        doublets_df.ix[
-            (doublets_df.chrom == chrom) & (
-                doublets_df.Pos_A >= chrom_lengths[chrom]),
-            ['Pos_A']] = np.array(
-                doublets_df.ix[
-                    (doublets_df.chrom == chrom) & (
-                        doublets_df.Pos_A >= chrom_lengths[chrom]),
-                    ['Pos_A']]) - chrom_lengths[chrom]
-
-        # Check right doesn't extend past chromosome end
-        doublets_df.ix[
-            (doublets_df.chrom == chrom) & (
-                doublets_df.Pos_B >= chrom_lengths[chrom]),
-            ['Pos_B']] = np.array(
-                doublets_df.ix[
-                    (doublets_df.chrom == chrom) & (
-                        doublets_df.Pos_B >= chrom_lengths[chrom]),
-                    ['Pos_B']]) - chrom_lengths[chrom]
-
-    for chrom in chrom_lengths.keys():
-
-        randomize_chrom(chrom, shift)
+    # Look up the length of the chromosome of every interaction.
+    # Interactions on chromosomes missing from chrom_lengths are left
+    # where they are.
+    interaction_chrom_lengths = doublets_df.chrom.map(chrom_lengths)
+    on_known_chrom = interaction_chrom_lengths.notnull().values
+    chrom_len = interaction_chrom_lengths.values[on_known_chrom].astype(int)[:, None]
+
+    # If a shift is bigger than the length of the chromosome,
+    # the end result is the same as shifting by the remainder
+    # when shift is divided by the chromosome length
+    shifted = np.array(
+        doublets_df.loc[on_known_chrom, ['Pos_A', 'Pos_B']]) + (shift % chrom_len)
+
+    # Check neither end extends past chromosome end
+    shifted -= chrom_len * (shifted >= chrom_len)
+
+    doublets_df.loc[on_known_chrom, ['Pos_A', 'Pos_B']] = shifted
 
     return doublets_df
 
@@ -217,6 +217,11 @@ matrix_parser.add_argument(
     'same name as the segregation file and an extension indicating the '
     'genomic region(s) and the matrix method')
 
+matrix_parser.add_argument(
+    '-p', '--processes', default=1, type=int,
+    help='Number of processes to use when calculating the matrix '
+    '(default is 1)')
+
 matrix_parser.set_defaults(func=cosegregation.matrix_from_args)
 
 
@@ -48,6 +48,19 @@ of disk space and are slow to read and write. GAMtools can also read and write
 to gzipped text files by using the txt.gz format (these take up much less disk
 space).
 
+zarr
+----
+
+Zarr format stores the matrix as a directory of separately compressed
+chunks (see https://zarr.readthedocs.io). When only a sub-region of a
+large matrix is needed (e.g. with :func:`open_region_from_locations`),
+only the chunks overlapping that sub-region are read from disk and
+decompressed. Chunks are compressed with Blosc (zstd), which is much faster
+to write than the zlib compression used by npz. Like npz, zarr matrices can
+have any number of dimensions.
+Reading or writing zarr matrices requires version 2 of the zarr package to be
+installed (zarr 3 is not supported).
+
 triangular
 ----------
 
@@ -77,8 +90,9 @@ heatmap image.
 
 import sys
 import os
-import itertools
+import io
 import argparse
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -93,6 +107,25 @@ except ImportError:
         'Saving a matrix as an image requires matplotlib to be installed. '
         'Try to install it by running "pip install matplotlib"')
 
+try:
+    import zarr
+    from numcodecs import Blosc
+    # zarr 3 writes a different format and no longer accepts numcodecs
+    # compressors, so only zarr 2 is supported
+    if int(zarr.__version__.split('.')[0]) >= 3:
+        raise ImportError('zarr {} is not supported'.format(zarr.__version__))
+except ImportError:
+    zarr = Blosc = DelayedImportError(
+        'Reading or writing zarr matrices requires zarr version 2 to be '
+        'installed. Try to install it by running "pip install \'zarr<3\'"')
+
+# Maximum number of matrix elements stored in each chunk of a zarr matrix.
+# 2 ** 20 gives 1024 x 1024 chunks for a 2D matrix.
+ZARR_CHUNK_ELEMENTS = 2 ** 20
+
+# Maximum number of matrix elements thresholded at once by apply_threshold.
+THRESHOLD_CHUNK_ELEMENTS = 2 ** 20
+
 
 def get_name_strings(windows):
     """Format a list of tuples representing genomic windows (chrom, start, stop)
@@ -210,21 +243,60 @@ def read_triangular(filepath):
     """
 
     with open(filepath) as in_data:
-        arr = [[float(i) for i in line.split()] for line in in_data]
-    size = len(arr[-1])
-    proximity_matrix = np.zeros((size, size))
-    lower_i = np.tril_indices_from(proximity_matrix)
-    upper_i = np.triu_indices_from(proximity_matrix)
-    proximity_matrix[:] = np.NAN
-    proximity_matrix[lower_i] = list(itertools.chain(*arr))
-    proximity_matrix[upper_i] = proximity_matrix.T[upper_i]
+        size = sum(1 for line in in_data if line.strip())
+        in_data.seek(0)
+
+        proximity_matrix = np.zeros((size, size))
+
+        # Row i of the lower triangle contributes i + 1 values, which are
+        # parsed straight into row i and column i of the matrix
+        for row, line in enumerate(l for l in in_data if l.strip()):
+            with warnings.catch_warnings():
+                # np.fromstring only warns when it cannot parse a value
+                warnings.simplefilter('error', DeprecationWarning)
+                try:
+                    row_values = np.fromstring(line, sep=' ')
+                except DeprecationWarning:
+                    row_values = None
+
+            if row_values is None or row_values.size != row + 1:
+                raise ValueError(
+                    'Line {} of {} should contain {} numbers: {}'.format(
+                        row + 1, filepath, row + 1, line.strip()))
+
+            proximity_matrix[row, :row + 1] = row_values
+            proximity_matrix[:row + 1, row] = row_values
+
     proximity_matrix[proximity_matrix > 1.] = np.NAN
 
     return None, proximity_matrix
 
 
+def read_zarr(filepath):
+    """Open a zarr directory containing a proximity matrix
+
+    The matrix is not read into memory, instead a :class:`zarr.core.Array`
+    is returned which only loads the chunks that are accessed when it
+    is sliced.
+
+    :param str filepath: Path to the zarr directory
+    :returns: List of lists giving genomic locations for each bin on each axis, and a\
+            :class:`zarr array <zarr.core.Array>` proximity matrix.
+    """
+
+    group = zarr.open_group(filepath, mode='r')
+    proximity_matrix = group['scores']
+
+    windows = [
+        windows_from_name_strings(group['windows_{}'.format(i)][:])
+        for i in range(proximity_matrix.ndim)]
+
+    return windows, proximity_matrix
+
+
 INPUT_FORMATS = {
     'npz': read_npz,
+    'zarr': read_zarr,
     'txt': read_txt,
     'txt.gz': read_txt,
     'triangular': read_triangular,
@@ -239,7 +311,8 @@ def write_txt(windows, proximity_matrix, output_file):
     :param tuple windows: (list of x-axis windows, list of y-axis windows)
     :param proximity_matrix: Input proximity matrix.
     :type proximity_matrix: :class:`numpy array <numpy.ndarray>`
-    :param str filepath: Path to save matrix file.
+    :param str filepath: Path to save matrix file, or an open file \
+            handle (in text or binary mode).
 
     >>> my_matrix = np.array([[10, 0, 5],
     ...                       [0, 10, 3],
@@ -258,12 +331,29 @@ def write_txt(windows, proximity_matrix, output_file):
             'Plain text output is only supported for 2 dimensional matrices. '
             'Please try saving as an npz file.')
 
+    if not hasattr(output_file, 'write'):
+        with open(output_file, 'w') as output_handle:
+            write_txt(windows, proximity_matrix, output_handle)
+        return
+
     names_0, names_1 = [get_name_strings(
         axis_windows) for axis_windows in windows]
 
-    pd.DataFrame(
-        proximity_matrix, index=names_0, columns=names_1).to_csv(
-            output_file, sep='\t', na_rep="NaN")
+    # Binary handles (e.g. from gzip.open) need encoded lines
+    encode = isinstance(output_file, (io.BufferedIOBase, io.RawIOBase))
+
+    def write_line(line):
+        """Write one line of text to output_file"""
+        output_file.write(line.encode() if encode else line)
+
+    write_line('\t' + '\t'.join(names_1) + '\n')
+
+    # Each row is formatted in a single join. Converting with astype(str)
+    # gives the shortest string that reads back as the same number for
+    # the matrix dtype, and missing values are written as "NaN".
+    for name, row in zip(names_0, np.asarray(proximity_matrix)):
+        values = '\t'.join(row.astype(str)).replace('nan', 'NaN')
+        write_line(name + '\t' + values + '\n')
 
 
 def write_zipped_txt(windows, proximity_matrix, output_file):
@@ -300,6 +390,33 @@ def write_npz(windows, proximity_matrix, output_file):
     np.savez_compressed(output_file, scores=proximity_matrix, **window_dict)
 
 
+def write_zarr(windows, proximity_matrix, output_file):
+    """Write a proximity matrix to a zarr directory.
+
+    The matrix is split into chunks of at most ZARR_CHUNK_ELEMENTS
+    values, each of which is compressed separately (using Blosc with
+    zstd and byte shuffling), so that sub-regions of the matrix can be
+    read without decompressing the whole file.
+
+    :param tuple windows: (list of x-axis windows, list of y-axis windows)
+    :param proximity_matrix: Input proximity matrix.
+    :type proximity_matrix: :class:`numpy array <numpy.ndarray>`
+    :param str filepath: Path to save zarr directory.
+    """
+
+    chunk_side = int(ZARR_CHUNK_ELEMENTS ** (1. / proximity_matrix.ndim))
+
+    group = zarr.open_group(output_file, mode='w')
+    # compressor is the zarr 2 argument for a numcodecs codec
+    group.array('scores', proximity_matrix,
+                chunks=(chunk_side,) * proximity_matrix.ndim,
+                compressor=Blosc(cname='zstd', clevel=3,
+                                 shuffle=Blosc.SHUFFLE))
+
+    for i, win in enumerate(windows):
+        group.array('windows_{}'.format(i), np.array(get_name_strings(win)))
+
+
 def write_csv(windows, proximity_matrix, output_file):
     """Write a proximity matrix to a csv file.
 
@@ -325,12 +442,16 @@ def write_csv(windows, proximity_matrix, output_file):
     chr1    1       2       1       3
     """
 
-    interactions_df = pd.DataFrame(proximity_matrix).unstack()
-    interactions_df = interactions_df[interactions_df > 0]
-    interactions_df = interactions_df.reset_index()
-    interactions_df.columns = ['Pos_A', 'Pos_B', 'interaction']
-    interactions_df = interactions_df[
-        interactions_df.Pos_B > interactions_df.Pos_A]
+    # Only take one half of the matrix (Pos_B > Pos_A). Pos_A indexes
+    # the columns of the matrix and Pos_B indexes the rows.
+    pos_a, pos_b = np.triu_indices(n=proximity_matrix.shape[1], k=1,
+                                   m=proximity_matrix.shape[0])
+    interaction = proximity_matrix[pos_b, pos_a]
+    is_positive = interaction > 0
+
+    interactions_df = pd.DataFrame({'Pos_A': pos_a[is_positive],
+                                    'Pos_B': pos_b[is_positive],
+                                    'interaction': interaction[is_positive]})
     interactions_df['dist'] = interactions_df.Pos_B - interactions_df.Pos_A
     interactions_df['chrom'] = windows[0][0][0]
     output_cols = ['chrom', 'Pos_A', 'Pos_B', 'dist', 'interaction']
@@ -374,6 +495,7 @@ def write_png(windows, proximity_matrix, output_file): #pylint: disable=unused-a
 
 OUTPUT_FORMATS = {
     'npz': write_npz,
+    'zarr': write_zarr,
     'txt': write_txt,
     'txt.gz': write_zipped_txt,
     'csv': write_csv,
@@ -428,7 +550,9 @@ def read_file(file_name, file_type=None):
     :param str file_name: Path to matrix file.
     :returns: (list of genomic locations for x-axis, list of \
     genomic locations for y-axis), \
-            :class:`numpy array <numpy.ndarray>` proximity matrix.
+            :class:`numpy array <numpy.ndarray>` proximity matrix. \
+            zarr matrices are returned as a lazily loaded \
+            :class:`zarr array <zarr.core.Array>` (see :func:`read_zarr`).
     """
 
     if file_type is None:
@@ -540,14 +664,19 @@ def kth_diag_indices(array, diag_k):
     array([-2, -2])
     """
 
-    rows, cols = np.diag_indices_from(array)
+    if array.ndim != 2 or array.shape[0] != array.shape[1]:
+        raise ValueError('Input array must be a square matrix')
+
+    offset = abs(diag_k)
+    diag_i = np.arange(max(array.shape[0] - offset, 0))
+
     if diag_k < 0:
-        return rows[:diag_k], cols[-diag_k:]
+        return diag_i, diag_i + offset
 
     if diag_k > 0:
-        return rows[diag_k:], cols[:-diag_k]
+        return diag_i + offset, diag_i
 
-    return rows, cols
+    return diag_i, diag_i
 
 
 def apply_threshold(proximity_matrix, thresholds):
@@ -560,26 +689,47 @@ def apply_threshold(proximity_matrix, thresholds):
     adjacent windows). If the number of thresholds is less
     than the number of diagonals, the last threshold is repeated.
 
+    Only the upper triangle of the input matrix is used. Values that
+    pass the threshold are mirrored into the lower triangle, so the
+    output is always symmetrical, and the main diagonal is set to 0.
+    The matrix is processed in blocks of rows, each containing at most
+    THRESHOLD_CHUNK_ELEMENTS values.
+
     :param proximity_matrix: Input proximity matrix.
     :type proximity_matrix: :class:`numpy array <numpy.ndarray>`
     :param thresholds: Values to use as minimum thresholds.
     :type thresholds: :class:`pandas.DataFrame`
     """
 
+    size = proximity_matrix.shape[0]
+
+    # Look up the threshold for every diagonal (i.e. every distance) at once,
+    # falling back to the last threshold for any distance not in the table
+    threshold_values = thresholds.iloc[:, 0]
+    diagonal_thresholds = threshold_values.reindex(np.arange(size)).fillna(
+        threshold_values.iloc[-1]).values
+
     out_matr = np.zeros_like(proximity_matrix)
+    block_rows = max(1, THRESHOLD_CHUNK_ELEMENTS // max(1, size))
+
+    for start in range(0, size, block_rows):
+        stop = min(start + block_rows, size)
 
-    for diagonal in range(1, proximity_matrix.shape[0] + 1):
-        proximity_matrix_diag = proximity_matrix.diagonal(diagonal).copy()
+        block = np.array(proximity_matrix[start:stop])
+        distances = np.arange(size)[None, :] - np.arange(start, stop)[:, None]
 
-        try:
-            thresh = np.array(thresholds.loc[diagonal])
-        except KeyError:
-            thresh = np.array(thresholds.iloc[-1])
+        # Discard the lower triangle and anything below its diagonal's threshold
+        discard = distances <= 0
+        discard[~discard] = (block[~discard] <
+                             diagonal_thresholds[distances[~discard]])
+        block[discard] = 0.
 
-        below_thresh = proximity_matrix_diag < thresh
-        proximity_matrix_diag[below_thresh] = 0.
-        out_matr[kth_diag_indices(out_matr, diagonal)] = proximity_matrix_diag
-        out_matr[kth_diag_indices(out_matr, -diagonal)] = proximity_matrix_diag
+        # Mirror the upper triangle within this block of rows, and copy the
+        # values left of the block from the rows that have already been done
+        block[:, start:stop] += block[:, start:stop].T
+        block[:, :start] = out_matr[:start, start:stop].T
+
+        out_matr[start:stop] = block
 
     return out_matr
 
@@ -603,6 +753,10 @@ def convert(input_file, input_format, #pylint: disable=too-many-arguments
 
     _windows, proximity_matrix = INPUT_FORMATS[input_format](input_file)
 
+    # Chunked formats (i.e. zarr) are read lazily, but the whole
+    # matrix is needed for conversion
+    proximity_matrix = np.asarray(proximity_matrix)
+
     if input_format == 'triangular':
         if windows is None:
             raise argparse.ArgumentError(
@@ -87,24 +87,28 @@ def permute_segregation(input_segregation):
     # This means we preserve the locations of centromeres etc,
     # but requires that the input data has a large number of
     # columns
-    mappable = input_segregation.sum(axis=1).astype(bool)
-    no_windows, no_samples = input_segregation[mappable].shape
+    mappable = input_segregation.sum(axis=1).astype(bool).values
+    mappable_segregation = input_segregation[mappable]
+    no_windows, no_samples = mappable_segregation.shape
 
-    # Make a copy of the original data
-    permutation = input_segregation.copy()
+    # Permuted columns are written into a plain numpy copy of the
+    # original data, which is converted back to a DataFrame at the end
+    permutation = input_segregation.values.copy()
 
     # Loop over columns
     for i in range(no_samples):
 
         # Choose a random position to break the segregation in two,
-        # Swap the two chunks around and write them to the copied df
+        # Swap the two chunks around and write them to the copied array
         offset = np.random.randint(no_windows)
 
-        new_col = permute_by_chromosome(input_segregation.iloc[mappable.values, i], offset)
+        new_col = permute_by_chromosome(mappable_segregation.iloc[:, i], offset)
 
-        permutation.ix[mappable, i] = new_col
+        permutation[mappable, i] = new_col
 
-    return permutation
+    return pd.DataFrame(permutation,
+                        index=input_segregation.index,
+                        columns=input_segregation.columns)
 
 
 def permute_segregation_autosomal(input_segregation, autosomes=None):
@@ -9,6 +9,7 @@ radial position from GAM :ref:`segregation tables <segregation_table>`.
 """
 
 import numpy as np
+import pandas as pd
 
 from .segregation import open_segregation
 
@@ -22,16 +23,16 @@ def get_radial_position(segregation_data, no_blanks=False):
     # Get the percentage genome coverage for each NP
     cov_per_np = 100 * segregation_data.mean()
 
-    def get_window_radial_pos(segregation_row):
-        """Internal function that calculates radial position for each row"""
+    # Which NPs are positive for each window?
+    nps_with_window = segregation_data.values.astype(bool)
 
-        # Which NPs are positive for this window?
-        nps_with_window = segregation_row.values.astype(bool)
+    # Get the mean genome coverage of NPs positive for each window
+    # (windows that are never detected give 0 / 0 = NaN)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_coverage = nps_with_window.dot(cov_per_np.values) / \
+            nps_with_window.sum(axis=1)
 
-        # Get the mean genome coverage of NPs positive for this window
-        return cov_per_np[nps_with_window].mean()
-
-    radial_position = segregation_data.apply(get_window_radial_pos, axis=1)
+    radial_position = pd.Series(mean_coverage, index=segregation_data.index)
 
     if no_blanks:
         radial_position = radial_position[
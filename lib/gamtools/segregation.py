@@ -63,12 +63,82 @@ import os
 import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+    from pyarrow import compute as pyarrow_compute
+except ImportError:
+    pyarrow_csv = None
+
 
 class InvalidChromError(Exception):
     """Exception to be raised when an invalid chromosome is specified"""
     pass
 
 
+def _is_window_table(table):
+    """
+    Internal function that checks whether a table parsed by pyarrow with a
+    tab delimiter matches what pandas would read from a whitespace
+    delimited file.
+
+    Tables with fewer than four columns (e.g. space delimited files), column
+    names that are empty, duplicated or contain whitespace, non-numeric
+    columns after the chromosome, or whitespace in the chromosome column
+    are not accepted.
+    """
+
+    names = table.column_names
+
+    if len(names) <= 3 or len(set(names)) != len(names):
+        return False
+
+    if any(name.split() != [name] for name in names):
+        return False
+
+    for column in table.columns[1:]:
+        if not (pyarrow.types.is_integer(column.type) or
+                pyarrow.types.is_floating(column.type)):
+            return False
+
+    chroms = table.column(0).cast(pyarrow.string())
+
+    return not pyarrow_compute.any(
+        pyarrow_compute.match_substring_regex(chroms, r'\s')).as_py()
+
+
+def read_window_table(path_or_buffer):
+    """
+    Read a whitespace delimited table where the first three columns give the
+    chromosome, start and stop of a genomic window (e.g. a segregation table).
+
+    If pyarrow is installed and path_or_buffer is the path to a tab
+    delimited file, the file is parsed with pyarrow's multi-threaded csv
+    reader, which is much faster for large tables. Otherwise (or if the
+    file is not a clean tab delimited table, see :func:`_is_window_table`)
+    the table is read by pandas.
+
+    :param path_or_buffer: Path to input table, or open python file object.
+    :returns: :class:`pandas.DataFrame` indexed by the first three columns.
+    """
+
+    if pyarrow_csv is not None and isinstance(path_or_buffer, str):
+        try:
+            table = pyarrow_csv.read_csv(
+                path_or_buffer,
+                parse_options=pyarrow_csv.ParseOptions(delimiter='\t'))
+
+            if _is_window_table(table):
+                window_table = table.to_pandas()
+                return window_table.set_index(list(window_table.columns[:3]))
+        except ValueError:
+            pass
+
+    return pd.read_csv(path_or_buffer,
+                       index_col=[0, 1, 2],
+                       delim_whitespace=True)
+
+
 def open_segregation(path_or_buffer):
     """
     Open a segregation table from a file.
@@ -77,9 +147,7 @@ def open_segregation(path_or_buffer):
     :returns: :ref:`segregation table <segregation_table>`
     """
 
-    return pd.read_csv(path_or_buffer,
-                       index_col=[0, 1, 2],
-                       delim_whitespace=True)
+    return read_window_table(path_or_buffer)
 
 
 def index_from_interval(segregation_table, interval):
@@ -1,4 +1,4 @@
-from gamtools import segregation, cosegregation
+from gamtools import segregation, cosegregation, cosegregation_internal, matrix
 import io
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 import pytest
@@ -111,6 +111,51 @@ def test_cosegregation_min():
 
     assert_array_equal(cosegregation_res, np.array([[ 0.0 ]]))
 
+def test_cosegregation_frequency_ndim():
+
+    freqs = cosegregation.cosegregation_frequency_ndim(np.array(data_region_c))
+
+    assert_array_equal(freqs, np.array([[ 7., 1. ],
+                                        [ 1., 2. ]]))
+
+def test_cosegregation_nd():
+
+    freqs = cosegregation.cosegregation_nd(np.array(data_region_c),
+                                           np.array(data_region_c))
+
+    assert freqs.shape == (2, 2, 2, 2)
+    assert_array_equal(freqs[0, 1], np.array([[ 7., 1. ],
+                                              [ 1., 2. ]]))
+    assert_array_equal(freqs[..., 1, 1],
+                       cosegregation.get_cosegregation_from_regions(data_region_c))
+
+def test_cosegregation_packed():
+
+    region_a, region_b = np.array(data_region_a), np.array(data_region_b)
+
+    assert_array_equal(cosegregation.cosegregation_packed(region_a, region_b),
+                       cosegregation_internal.cosegregation_2d(region_a, region_b))
+
+def test_cosegregation_packed_min_samples():
+
+    with patch('gamtools.cosegregation.PACKED_MIN_SAMPLES', 1):
+        packed_freqs = cosegregation.get_cosegregation_from_regions(data_region_a,
+                                                                    data_region_b)
+
+    assert_array_equal(packed_freqs,
+                       cosegregation.get_cosegregation_from_regions(data_region_a,
+                                                                    data_region_b))
+
+def test_cosegregation_packed_chunks():
+
+    with patch('gamtools.cosegregation.PACKED_CHUNK_BYTES', 1):
+        segregation_freqs = cosegregation.cosegregation_packed(np.array(data_region_a),
+                                                               np.array(data_region_b))
+
+    assert_array_equal(segregation_freqs, np.array([[ 2., 1., 0.],
+                                                    [ 3., 2., 1.],
+                                                    [ 2., 3., 1.]]))
+
 
 #########################################
 #
@@ -310,3 +355,53 @@ def test_dprime_invalid_data():
 
    with pytest.raises(cosegregation.InvalidDataError):
        cosegregation.get_dprime_from_regions(data_invalid_data)
+
+
+#########################################
+#
+# cosegregation.matrix_from_regions tests
+#
+#########################################
+
+def test_matrix_from_regions_one_region():
+
+    dprime_res = cosegregation.matrix_from_regions(
+        cosegregation.get_dprime_from_regions, [data_region_c], processes=2)
+
+    assert_array_almost_equal(dprime_res, np.array([[ 1.0, 0.541667 ],
+                                                     [ 0.541667, 1.0 ]]))
+
+def test_matrix_from_regions_processes():
+
+    segregation_freqs = cosegregation.matrix_from_regions(
+        cosegregation.get_cosegregation_from_regions,
+        [data_region_a, data_region_b], processes=2)
+
+    assert_array_equal(segregation_freqs, np.array([[ 2., 1., 0.],
+                                                    [ 3., 2., 1.],
+                                                    [ 2., 3., 1.]]))
+
+def test_matrix_from_regions_arrays():
+
+    linkage_res = cosegregation.matrix_from_regions(
+        cosegregation.get_linkage_from_regions,
+        [np.array(data_region_a), np.array(data_region_b)], processes=2)
+
+    assert_array_almost_equal(
+        linkage_res,
+        cosegregation.get_linkage_from_regions(data_region_a, data_region_b))
+
+def test_create_and_save_contact_matrix(tmpdir):
+
+    segregation_file = tmpdir.join('segregation.table')
+    segregation_file.write(fixture_region_a.getvalue())
+    output_file = str(tmpdir.join('matrix.npz'))
+
+    cosegregation.create_and_save_contact_matrix(
+        str(segregation_file), ['chr1'], output_file, 'npz', 'cosegregation')
+
+    windows, saved_matrix = matrix.read_npz(output_file)
+
+    assert_array_equal(saved_matrix, np.array([[ 6., 3., 1.],
+                                               [ 3., 5., 2.],
+                                               [ 1., 2., 4.]]))
@@ -0,0 +1,37 @@
+from gamtools import enrichment
+import pandas as pd
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+doublets = pd.DataFrame([('chr1', 10, 30, 0.75),
+                         ('chr1', 40, 45, 0.5),
+                         ('chr2', 10, 20, 0.4),
+                         ('chr3', 10, 20, 0.3)],
+                        columns=['chrom', 'Pos_A', 'Pos_B', 'interaction'])
+
+chrom_lengths = {'chr1': 50, 'chr2': 35}
+
+def test_randomize_doublets():
+
+    with patch('gamtools.enrichment.np.random.randint', return_value=25) as mock_randint:
+        randomized = enrichment.randomize_doublets(doublets, chrom_lengths)
+
+    mock_randint.assert_called_once_with(1, 50)
+
+    # Both ends can wrap around the end of the chromosome, chr3 has no
+    # length so it is left unchanged
+    assert list(randomized.Pos_A) == [35, 15, 0, 10]
+    assert list(randomized.Pos_B) == [5, 20, 10, 20]
+    assert list(randomized.chrom) == list(doublets.chrom)
+    assert list(randomized.interaction) == list(doublets.interaction)
+
+def test_randomize_doublets_large_shift():
+
+    # chr2 is shorter than the shift, so it is shifted by 45 % 35 = 10
+    with patch('gamtools.enrichment.np.random.randint', return_value=45):
+        randomized = enrichment.randomize_doublets(doublets, chrom_lengths)
+
+    assert list(randomized.Pos_A) == [5, 35, 20, 10]
+    assert list(randomized.Pos_B) == [25, 40, 30, 20]
@@ -2,7 +2,13 @@ import io
 
 import pytest
 import numpy as np
+import pandas as pd
 from gamtools import matrix
+from gamtools.utils import DelayedImportError
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
 
 
 @pytest.fixture
@@ -93,3 +99,183 @@ def test_trans_matrix_file_offcentre_region(trans_matrix):
 
     np.testing.assert_array_equal(subregion,
                        np.array([[9,10],[13,14]]))
+
+
+def test_apply_threshold():
+
+    proximity_matrix = np.array([[1., 0.6, 0.2, 0.9],
+                                 [0.6, 1., 0.4, 0.2],
+                                 [0.2, 0.4, 1., 0.5],
+                                 [0.9, 0.2, 0.5, 1.]])
+    thresholds = pd.DataFrame({'distance': [1, 2],
+                               'threshold': [0.45, 0.1]}).set_index('distance')
+
+    np.testing.assert_array_equal(matrix.apply_threshold(proximity_matrix, thresholds),
+                                  np.array([[0., 0.6, 0.2, 0.9],
+                                            [0.6, 0., 0., 0.2],
+                                            [0.2, 0., 0., 0.5],
+                                            [0.9, 0.2, 0.5, 0.]]))
+
+
+def test_apply_threshold_mirrors_upper_triangle():
+
+    proximity_matrix = np.array([[1., 0.6, 0.2],
+                                 [0.1, 1., 0.4],
+                                 [0.8, 0.9, 1.]])
+    thresholds = pd.DataFrame({'distance': [1],
+                               'threshold': [0.45]}).set_index('distance')
+
+    np.testing.assert_array_equal(matrix.apply_threshold(proximity_matrix, thresholds),
+                                  np.array([[0., 0.6, 0.],
+                                            [0.6, 0., 0.],
+                                            [0., 0., 0.]]))
+
+
+def test_apply_threshold_blocks():
+
+    rng = np.random.RandomState(0)
+    proximity_matrix = rng.rand(10, 10)
+    thresholds = pd.DataFrame({'distance': [1, 2, 3],
+                               'threshold': [0.5, 0.2, 0.7]}).set_index('distance')
+
+    with patch('gamtools.matrix.THRESHOLD_CHUNK_ELEMENTS', 30):
+        blocked = matrix.apply_threshold(proximity_matrix, thresholds)
+
+    np.testing.assert_array_equal(blocked,
+                                  matrix.apply_threshold(proximity_matrix, thresholds))
+
+
+def test_kth_diag_indices_not_square():
+
+    with pytest.raises(ValueError):
+        matrix.kth_diag_indices(np.zeros((5, 3)), 0)
+
+
+def test_read_triangular(tmpdir):
+
+    triangular_file = tmpdir.join('pi_matrix.txt')
+    triangular_file.write('0.5\n0.2 0.6\n0.1 1.5 0.7\n')
+
+    windows, proximity_matrix = matrix.read_triangular(str(triangular_file))
+
+    assert windows is None
+    np.testing.assert_array_equal(proximity_matrix,
+                                  np.array([[0.5, 0.2, 0.1],
+                                            [0.2, 0.6, np.nan],
+                                            [0.1, np.nan, 0.7]]))
+
+
+def test_read_triangular_bad_value(tmpdir):
+
+    # Only one value can be read before 'NA', which on its own
+    # would still be a valid 1 x 1 triangular matrix
+    triangular_file = tmpdir.join('pi_matrix.txt')
+    triangular_file.write('0.5\nNA 0.6\n0.1 0.3 0.7\n')
+
+    with pytest.raises(ValueError):
+        matrix.read_triangular(str(triangular_file))
+
+
+@pytest.mark.parametrize('contents', ['0.5\n0.2 0.6x\n0.1 0.3 0.7\n',
+                                      '0.5\n0.2 0.6 0.4\n0.1 0.3\n'])
+def test_read_triangular_bad_rows(tmpdir, contents):
+
+    triangular_file = tmpdir.join('pi_matrix.txt')
+    triangular_file.write(contents)
+
+    with pytest.raises(ValueError):
+        matrix.read_triangular(str(triangular_file))
+
+
+# matrix.zarr is only usable if a supported version of zarr is installed
+requires_zarr = pytest.mark.skipif(isinstance(matrix.zarr, DelayedImportError),
+                                   reason='zarr 2 is not installed')
+
+
+@requires_zarr
+def test_zarr_region(tmpdir):
+
+    windows = [('chr1', i * 1000, (i + 1) * 1000) for i in range(4)]
+    proximity_matrix = np.arange(16.).reshape((4, 4))
+    zarr_path = str(tmpdir.join('matrix.zarr'))
+
+    matrix.write_zarr([windows, windows], proximity_matrix, zarr_path)
+
+    assert matrix.detect_file_type(zarr_path) == 'zarr'
+
+    (w1, w2), subregion = matrix.open_region_from_locations(zarr_path, 'chr1:2000-4000')
+
+    np.testing.assert_array_equal(subregion,
+                       np.array([[10., 11.], [14., 15.]]))
+
+
+@requires_zarr
+def test_zarr_compressor(tmpdir):
+
+    windows = [('chr1', i * 1000, (i + 1) * 1000) for i in range(4)]
+    zarr_path = str(tmpdir.join('matrix.zarr'))
+
+    matrix.write_zarr([windows, windows], np.eye(4), zarr_path)
+
+    scores = matrix.zarr.open_group(zarr_path, mode='r')['scores']
+
+    assert scores.compressor.codec_id == 'blosc'
+    assert scores.compressor.cname == 'zstd'
+
+
+def test_write_csv():
+
+    proximity_matrix = np.array([[10, 0, 5],
+                                 [0, 10, 3],
+                                 [5, 3, 10]])
+    windows = [('chr1', 0, 10), ('chr1', 10, 20), ('chr1', 20, 30)]
+    output = io.StringIO()
+
+    matrix.write_csv([windows, windows], proximity_matrix, output)
+
+    assert output.getvalue() == (u'chrom\tPos_A\tPos_B\tdist\tinteraction\n'
+                                 u'chr1\t0\t2\t2\t5\n'
+                                 u'chr1\t1\t2\t1\t3\n')
+
+
+def test_write_txt():
+
+    proximity_matrix = np.array([[1.0, np.nan],
+                                 [0.25, 1.0]])
+    windows = [('chr1', 0, 10), ('chr1', 10, 20)]
+    output = io.StringIO()
+
+    matrix.write_txt([windows, windows], proximity_matrix, output)
+
+    assert output.getvalue() == (u'\tchr1:0-10\tchr1:10-20\n'
+                                 u'chr1:0-10\t1.0\tNaN\n'
+                                 u'chr1:10-20\t0.25\t1.0\n')
+
+
+def test_write_txt_float32():
+
+    proximity_matrix = np.array([[2.0595028, 0.1],
+                                 [0.1, 1.0]], dtype=np.float32)
+    windows = [('chr1', 0, 10), ('chr1', 10, 20)]
+    output = io.StringIO()
+
+    matrix.write_txt([windows, windows], proximity_matrix, output)
+
+    assert output.getvalue() == (u'\tchr1:0-10\tchr1:10-20\n'
+                                 u'chr1:0-10\t2.0595028\t0.1\n'
+                                 u'chr1:10-20\t0.1\t1.0\n')
+
+
+def test_write_zipped_txt(tmpdir):
+
+    proximity_matrix = np.array([[10, 0],
+                                 [0, 10]])
+    windows = [('chr1', 0, 10), ('chr1', 10, 20)]
+    zipped_path = str(tmpdir.join('matrix.txt.gz'))
+
+    matrix.write_zipped_txt([windows, windows], proximity_matrix, zipped_path)
+
+    (windows_0, windows_1), saved_matrix = matrix.read_txt(zipped_path)
+
+    np.testing.assert_array_equal(saved_matrix, proximity_matrix)
+    assert list(windows_0) == windows
@@ -0,0 +1,34 @@
+from gamtools import segregation, radial_position
+import io
+import numpy as np
+
+fixture_segregation = io.StringIO(
+u"""chrom start  stop    A B C D
+chr1    0       50000   1 0 1 0
+chr1    50000   100000  0 1 1 0
+chr1    100000  150000  0 0 0 0
+chr1    150000  200000  1 0 0 1
+""")
+
+data_segregation = segregation.open_segregation(fixture_segregation)
+
+# Percentage of windows detected by each NP: A 50, B 25, C 50, D 25
+
+def test_radial_position():
+
+    radial_pos = radial_position.get_radial_position(data_segregation)
+
+    assert list(radial_pos.index) == list(data_segregation.index)
+    np.testing.assert_array_almost_equal(radial_pos.values,
+                                         np.array([50., 37.5, np.nan, 37.5]))
+
+def test_radial_position_no_blanks():
+
+    radial_pos = radial_position.get_radial_position(data_segregation,
+                                                     no_blanks=True)
+
+    assert list(radial_pos.index) == [('chr1', 0, 50000),
+                                      ('chr1', 50000, 100000),
+                                      ('chr1', 150000, 200000)]
+    np.testing.assert_array_almost_equal(radial_pos.values,
+                                         np.array([50., 37.5, 37.5]))
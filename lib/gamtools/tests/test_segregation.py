@@ -1,6 +1,7 @@
 from gamtools import segregation
 import io
 import pytest
+import pandas as pd
 
 fixture_two_samples = io.StringIO(
 u"""chrom   start   stop    Sample_A    Sample_B
@@ -77,3 +78,54 @@ def test_invalid_chromosome():
     with pytest.raises(segregation.InvalidChromError):
         segregation.index_from_interval(data_two_samples, interval)
 
+
+def test_open_segregation_tab_delimited_file(tmpdir):
+    segregation_file = tmpdir.join('segregation.table')
+    segregation_file.write(
+        u'chrom\tstart\tstop\tSample_A\tSample_B\n'
+        u'chr1\t0\t50000\t0\t1\n'
+        u'chr1\t50000\t100000\t1\t0\n')
+    data = segregation.open_segregation(str(segregation_file))
+    assert list(data.index.names) == ['chrom', 'start', 'stop']
+    assert list(data.columns) == ['Sample_A', 'Sample_B']
+    assert data.loc[('chr1', 50000, 100000), 'Sample_A'] == 1
+
+def test_open_segregation_space_delimited_file(tmpdir):
+    segregation_file = tmpdir.join('segregation.table')
+    segregation_file.write(
+        u'chrom start stop Sample_A Sample_B\n'
+        u'chr1  0     50000  0 1\n'
+        u'chr1  50000 100000 1 0\n')
+    data = segregation.open_segregation(str(segregation_file))
+    assert list(data.columns) == ['Sample_A', 'Sample_B']
+    assert data.loc[('chr1', 50000, 100000), 'Sample_A'] == 1
+
+def check_matches_pandas(tmpdir, table_contents):
+    segregation_file = tmpdir.join('segregation.table')
+    segregation_file.write(table_contents)
+    data = segregation.open_segregation(str(segregation_file))
+    expected = pd.read_csv(str(segregation_file), index_col=[0, 1, 2],
+                           delim_whitespace=True)
+    pd.testing.assert_frame_equal(data, expected)
+    return data
+
+def test_open_segregation_mixed_delimiters(tmpdir):
+    data = check_matches_pandas(tmpdir,
+        u'chrom\tstart stop\tSample_A\tSample_B\n'
+        u'chr1\t0 50000\t0\t1\n'
+        u'chr1\t50000 100000\t1\t0\n')
+    assert list(data.columns) == ['Sample_A', 'Sample_B']
+
+def test_open_segregation_trailing_tabs(tmpdir):
+    data = check_matches_pandas(tmpdir,
+        u'chrom\tstart\tstop\tSample_A\tSample_B\t\n'
+        u'chr1\t0\t50000\t0\t1\t\n'
+        u'chr1\t50000\t100000\t1\t0\t\n')
+    assert list(data.columns) == ['Sample_A', 'Sample_B']
+
+def test_open_segregation_duplicate_samples(tmpdir):
+    data = check_matches_pandas(tmpdir,
+        u'chrom\tstart\tstop\tSample_A\tSample_A\n'
+        u'chr1\t0\t50000\t0\t1\n'
+        u'chr1\t50000\t100000\t1\t0\n')
+    assert list(data.columns) == ['Sample_A', 'Sample_A.1']
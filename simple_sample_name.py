@@ -18,5 +18,5 @@ if __name__ == '__main__':
     args = parser.parse_args()
 
     for line in args.input_file:
-        print clean_line(line)
+        sys.stdout.write(clean_line(line) + '\n')
 